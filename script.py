@@ -6,229 +6,322 @@ Ensure you comply with Google's ToS and applicable laws.
 
 import asyncio
 import json
+import logging
+import queue
 import re
-from playwright.async_api import async_playwright
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 import csv
+import operator
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
 from datetime import datetime
 
-class GoogleMapsScraper:
-    def __init__(self):
-        self.results = []
+logger = logging.getLogger(__name__)
+
+# Resources the scraper never reads - only the DOM matters
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+BLOCKED_DOMAINS = ('google-analytics.com', 'doubleclick.net', 'googletagmanager.com')
+
+# Output columns, in the order they are written
+FIELDS = ('name', 'rating', 'reviews', 'address', 'phone', 'website', 'hours',
+          'email', 'social_media', 'category', 'plus_code', 'url')
+_get_row = operator.itemgetter(*FIELDS)
+
+# Unique business URLs in the results feed. a.href is already absolute;
+# origin + pathname drops query string and fragment
+_PLACE_URLS_JS = """() => [...new Set(
+    [...document.querySelectorAll('a[href*="/maps/place/"]')]
+        .map(a => { const u = new URL(a.href); return u.origin + u.pathname; })
+)]"""
+
+_FILENAME_RE = re.compile(r'[^\w\-]')
+
+class _QueryLogger(logging.LoggerAdapter):
+    """Prefix records with the search query they belong to (several queries log at once)"""
+    def process(self, msg, kwargs):
+        # The prefix becomes part of the %-format string, so a '%' in the query must be escaped
+        query = self.extra['query'].replace('%', '%%')
+        return f"[{query}] {msg}", kwargs
+
+class _ResultStream:
+    """Append businesses to <base_name>.csv and <base_name>.jsonl, creating the files on the first row"""
+    def __init__(self, base_name):
+        self.base_name = base_name
+        self.csv_file = None
+        self.jsonl_file = None
+        self.csv_writer = None
+    
+    def write(self, business_data):
+        if self.csv_file is None:
+            self.csv_file = open(f"{self.base_name}.csv", 'w', newline='', encoding='utf-8')
+            self.jsonl_file = open(f"{self.base_name}.jsonl", 'w', encoding='utf-8')
+            self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=FIELDS)
+            self.csv_writer.writeheader()
+        
+        self.csv_writer.writerow(business_data)
+        self.csv_file.flush()
+        self.jsonl_file.write(json.dumps(business_data, ensure_ascii=False) + '\n')
+        self.jsonl_file.flush()
     
-    async def scrape_businesses(self, search_query, max_results=None):
+    def close(self):
+        for f in (self.csv_file, self.jsonl_file):
+            if f is not None:
+                f.close()
+
+class GoogleMapsScraper:
+    async def scrape_businesses(self, search_query, max_results, browser, concurrency=8):
         """
         Scrape business information from Google Maps
         
         Args:
             search_query: Search term (e.g., "Freight Broker Doral")
             max_results: Maximum number of businesses to scrape (None = unlimited, scrape until end)
+            browser: Playwright browser shared by all queries (a fresh context is opened per query)
+            concurrency: Number of detail pages scraped in parallel
+        
+        Detail workers start on businesses while the results list is still
+        scrolling. Each business is appended to <query>.csv and <query>.jsonl as
+        soon as it is scraped, so partial results survive a crash.
+        
+        Returns:
+            List of business dicts for this query
         """
-        async with async_playwright() as p:
-            # Launch browser (headless=False to see what's happening)
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            page = await context.new_page()
+        results = []
+        log = _QueryLogger(logger, {'query': search_query})
+        # Each query gets its own context so concurrent queries stay isolated
+        context = await browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        )
+        # Skip images, fonts, media and trackers (scripts stay on, Maps needs them)
+        await context.route('**/*', self._block_resources)
+        page = await context.new_page()
+        
+        try:
+            log.info("Searching for: %s", search_query)
             
+            # Navigate to Google Maps
+            await page.goto('https://www.google.com/maps', timeout=60000)
+            
+            # Search for the query
+            search_box = await page.wait_for_selector('input#searchboxinput', timeout=10000)
+            await search_box.fill(search_query)
+            await page.keyboard.press('Enter')
+            
+            # Wait for results to load
             try:
-                print(f"Searching for: {search_query}")
-                
-                # Navigate to Google Maps
-                await page.goto('https://www.google.com/maps', timeout=60000)
-                await page.wait_for_timeout(2000)
-                
-                # Search for the query
-                search_box = await page.wait_for_selector('input#searchboxinput', timeout=10000)
-                await search_box.fill(search_query)
-                await page.keyboard.press('Enter')
-                
-                # Wait for results to load
-                await page.wait_for_timeout(5000)
-                
-                # Scroll to load ALL results with robust handling
-                print("Loading all results by scrolling...")
-                await self._scroll_results_robust(page, max_results)
-                
-                # Get all business URLs (not elements, to avoid DOM detachment)
-                print("\nCollecting business URLs...")
-                business_urls = await self._get_all_business_urls(page)
-                
-                total_to_scrape = len(business_urls) if max_results is None else min(len(business_urls), max_results)
-                print(f"\n✓ Found {len(business_urls)} unique businesses")
-                print(f"Will scrape {total_to_scrape} businesses\n")
-                
-                # Scrape each business by navigating to URL
-                businesses_to_scrape = business_urls if max_results is None else business_urls[:max_results]
-                
-                for i, url in enumerate(businesses_to_scrape):
+                await page.wait_for_selector('div[role="feed"]', timeout=15000)
+            except PlaywrightTimeoutError:
+                pass
+            
+            # Business URLs flow from the scroller to the detail workers as they are found
+            url_queue = asyncio.Queue(maxsize=200)
+            
+            async def worker(detail_page):
+                scraped = []
+                while True:
+                    item = await url_queue.get()
+                    if item is None:
+                        return scraped
+                    i, url = item
                     try:
-                        print(f"Scraping business {i+1}/{total_to_scrape}", end='')
-                        
                         # Navigate directly to the business URL
-                        await page.goto(url, timeout=30000)
-                        await page.wait_for_timeout(2500)
+                        await detail_page.goto(url, timeout=30000)
                         
-                        business_data = await self._extract_business_data(page)
+                        business_data = await self._extract_business_data(detail_page, log)
                         if business_data and business_data.get('name') != 'not_available':
                             business_data['url'] = url  # Add the URL to data
-                            self.results.append(business_data)
-                            print(f" ✓ {business_data.get('name', 'Unknown')}")
+                            stream.write(business_data)
+                            scraped.append((i, business_data))
+                            log.info("Scraping business %d ✓ %s", i + 1, business_data.get('name', 'Unknown'))
                         else:
-                            print(f" ⚠ Could not extract data")
-                        
+                            log.warning("Scraping business %d ⚠ Could not extract data", i + 1)
+                    
                     except Exception as e:
-                        print(f" ✗ Error: {str(e)[:50]}")
-                        continue
-                
-            except Exception as e:
-                print(f"Error during scraping: {e}")
+                        log.error("Scraping business %d ✗ Error: %s", i + 1, str(e)[:50])
             
+            # Every worker gets its own page, opened up front so a failure here can't strand the scroller.
+            # No more workers than businesses we are allowed to scrape
+            workers = concurrency if max_results is None else max(1, min(concurrency, max_results))
+            detail_pages = [await context.new_page() for _ in range(workers)]
+            
+            # Stream rows to disk as they come in
+            base_name = self._sanitize_filename(search_query)
+            stream = _ResultStream(base_name)
+            try:
+                # Scroll to load ALL results with robust handling
+                log.info("Loading all results by scrolling...")
+                # If the scroller fails it still queues the sentinels, so the workers
+                # drain what was found before the files are closed
+                found, *scraped = await asyncio.gather(
+                    self._scroll_results_robust(page, max_results, url_queue, workers, log),
+                    *[worker(detail_page) for detail_page in detail_pages],
+                    return_exceptions=True
+                )
             finally:
-                await browser.close()
+                stream.close()
+            
+            # Keep the order the businesses appeared in the results list, even if part of the run failed
+            batches = [batch for batch in scraped if not isinstance(batch, BaseException)]
+            results = [data for _, data in sorted(item for batch in batches for item in batch)]
+            for outcome in (found, *scraped):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            log.info("✓ Found %d unique businesses, scraped %d", found, len(results))
+            if results:
+                log.info("✓ Results streamed to %s.csv and %s.jsonl", base_name, base_name)
+            
+        except Exception as e:
+            log.error("Error during scraping: %s", e)
+        
+        finally:
+            await context.close()
         
-        return self.results
+        return results
+    
+    async def _block_resources(self, route):
+        """Abort requests for resources that are not needed to read the page"""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(d in request.url for d in BLOCKED_DOMAINS):
+            await route.abort()
+        else:
+            await route.continue_()
     
-    async def _scroll_results_robust(self, page, max_results):
+    async def _scroll_results_robust(self, page, max_results, url_queue, workers, log):
         """
         ROBUST scrolling - keeps going until we see the end message (Google only shows it when TRULY done)
-        """
-        results_panel = await page.query_selector('div[role="feed"]')
-        if not results_panel:
-            print("⚠ Could not find results panel")
-            return
         
-        print("Scrolling until end message appears...")
-        scroll_count = 0
-        previous_count = 0
-        no_change_count = 0
+        Scrolling runs inside the browser in batches of 5 scrolls; after each
+        batch every new business URL is put on url_queue as (index, url). One None per
+        worker is queued at the end. Progress goes to `log`. Returns the number
+        of URLs queued.
+        """
+        seen = set()
         
-        while True:
-            # Scroll down in the results panel
-            await results_panel.evaluate('el => el.scrollBy(0, 1500)')
-            scroll_count += 1
-            
-            # Initial wait
-            await page.wait_for_timeout(1500)
-            
-            # Wait for any loading to finish
-            await self._wait_for_loading_complete(page)
-            
-            # Count current results
-            current_results = await page.query_selector_all('a[href*="/maps/place/"]')
-            current_count = len(current_results)
-            
-            # Check for the ACTUAL end message - if we see this, we're DONE
-            end_message = await page.query_selector('span:has-text("You\'ve reached the end of the list.")')
-            
-            if end_message:
-                print(f"\n✓ Found end message! Total results: {current_count}")
-                break
-            
-            # Display progress
-            print(f"Scroll #{scroll_count}: {current_count} results", end='\r')
-            
-            # Check if we've hit max_results limit (if set)
-            if max_results is not None and current_count >= max_results:
-                print(f"\n✓ Reached target of {max_results} results!")
-                break
-            
-            # Track stalls (no new results for many scrolls - backup safety)
-            if current_count == previous_count:
-                no_change_count += 1
-                # Only stop from stall if we've tried MANY times (backup measure)
-                if no_change_count >= 10:
-                    print(f"\n⚠ Stalled at {current_count} results (no new results after 10 scrolls)")
+        async def publish(urls):
+            for url in urls:
+                if max_results is not None and len(seen) >= max_results:
                     break
+                if url not in seen:
+                    seen.add(url)
+                    await url_queue.put((len(seen) - 1, url))
+        
+        try:
+            results_panel = await page.query_selector('div[role="feed"]')
+            if not results_panel:
+                log.warning("⚠ Could not find results panel")
             else:
-                no_change_count = 0
-            
-            previous_count = current_count
-            
-            # Safety limit (very high)
-            if scroll_count > 10000:
-                print("\n⚠ Reached maximum scroll limit (10,000)")
-                break
+                log.info("Scrolling until end message appears...")
+                scroll_count = 0
+                next_checkpoint = 100
+                current_count = 0
+                stalls = 0
+                
+                while True:
+                    state = await page.evaluate("""async ({previous, stalls, maxResults, maxStalls, batch}) => {
+                        const placeUrls = """ + _PLACE_URLS_JS + """;
+                        const panel = document.querySelector('div[role="feed"]');
+                        const sleep = (ms) => new Promise(r => setTimeout(r, ms));
+                        const count = () => document.querySelectorAll('a[href*="/maps/place/"]').length;
+                        // Count, end state and the URLs not returned before all come back in this one call.
+                        // Sent URLs are remembered in the page, so a listing inserted anywhere in the feed is still picked up
+                        const sent = (window.__sentUrls ??= new Set());
+                        const state = (reason) => {
+                            const urls = placeUrls().filter(u => !sent.has(u));
+                            urls.forEach(u => sent.add(u));
+                            return {count: count(), scrolls, stalls, reason, urls};
+                        };
+                        // Resolves as soon as no loading spinner is left (gives up after 10s)
+                        const loaded = () => new Promise(resolve => {
+                            const busy = () => document.querySelector('div[role="progressbar"], div.loading, div.spinner');
+                            if (!busy()) return resolve();
+                            const done = () => { observer.disconnect(); clearTimeout(timer); resolve(); };
+                            const observer = new MutationObserver(() => { if (!busy()) done(); });
+                            const timer = setTimeout(done, 10000);
+                            observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+                        });
+                        // `stalls` carries over from the previous round so the limit is consecutive scrolls
+                        let scrolls = 0, last = previous;
+                        while (true) {
+                            // Scroll down in the results panel
+                            panel.scrollBy(0, 1500);
+                            scrolls++;
+                            await sleep(800);
+                            
+                            // Wait for any loading to finish
+                            await loaded();
+                            
+                            const n = count();
+                            if (document.body.innerText.includes("You've reached the end of the list.")) {
+                                return state('end');
+                            }
+                            if (maxResults && n >= maxResults) {
+                                return state('target');
+                            }
+                            // Track stalls (no new results for many scrolls - backup safety)
+                            stalls = n > last ? 0 : stalls + 1;
+                            last = n;
+                            if (stalls >= maxStalls) {
+                                return state('stalled');
+                            }
+                            // Report back every `batch` scrolls once something new has loaded
+                            if (scrolls >= batch && n > previous) {
+                                return state('more');
+                            }
+                        }
+                    }""", {'previous': current_count, 'stalls': stalls, 'maxResults': max_results, 'maxStalls': 10, 'batch': 5})
+                    
+                    scroll_count += state['scrolls']
+                    current_count = state['count']
+                    stalls = state['stalls']
+                    
+                    # Hand the new businesses to the detail workers
+                    await publish(state['urls'])
+                    
+                    if state['reason'] == 'end':
+                        log.info("✓ Found end message! Total results: %d", current_count)
+                        break
+                    
+                    # Every 100 scrolls, show a checkpoint
+                    if scroll_count >= next_checkpoint:
+                        log.info("[Checkpoint: %d scrolls, %d results]", scroll_count, current_count)
+                        next_checkpoint += 100
+                    
+                    if state['reason'] == 'target' or (max_results is not None and len(seen) >= max_results):
+                        log.info("✓ Reached target of %d results!", max_results)
+                        break
+                    
+                    if state['reason'] == 'stalled':
+                        log.warning("⚠ Stalled at %d results (no new results after 10 scrolls)", current_count)
+                        break
+                    
+                    # Safety limit (very high)
+                    if scroll_count > 10000:
+                        log.warning("⚠ Reached maximum scroll limit (10,000)")
+                        break
+                
+                log.info("Total scrolls: %d | Final count: %d", scroll_count, current_count)
             
-            # Every 100 scrolls, show a checkpoint
-            if scroll_count % 100 == 0:
-                print(f"\n[Checkpoint: {scroll_count} scrolls, {current_count} results]")
+            # Pick up anything not queued yet
+            await publish(await self._get_all_business_urls(page))
         
-        print(f"Total scrolls: {scroll_count} | Final count: {current_count}")
-    
-    async def _wait_for_loading_complete(self, page):
-        """Wait for loading spinners to completely disappear before continuing"""
-        max_wait = 10  # Maximum 10 seconds to wait for loading
-        wait_count = 0
+        finally:
+            # Tell every worker there is nothing more to scrape
+            for _ in range(workers):
+                await url_queue.put(None)
         
-        while wait_count < max_wait:
-            # Check for common loading indicators
-            loading_indicators = await page.query_selector_all('div[role="progressbar"], div.loading, div.spinner')
-            
-            if not loading_indicators:
-                # No loading indicators found, we're good
-                break
-            
-            # Still loading, wait a bit more
-            await page.wait_for_timeout(1000)
-            wait_count += 1
-        
-        # Extra small wait to ensure content has rendered
-        await page.wait_for_timeout(500)
+        return len(seen)
     
     async def _get_all_business_urls(self, page):
-        """Extract all unique business URLs from the results - more thorough approach"""
-        print("Extracting business URLs thoroughly...")
-        
-        # Try multiple selectors to catch all possible business listings
-        selectors = [
-            'a[href*="/maps/place/"]',  # Standard place links
-            'a[data-value*="place"]',    # Alternative place links
-            'div[role="feed"] a[href*="maps"]',  # Any maps link in feed
-        ]
-        
-        all_links = []
-        for selector in selectors:
-            links = await page.query_selector_all(selector)
-            all_links.extend(links)
-        
-        print(f"Found {len(all_links)} total links (including duplicates)")
-        
-        seen_urls = set()
-        unique_urls = []
-        
-        for link in all_links:
-            try:
-                href = await link.get_attribute('href')
-                if not href or '/maps/place/' not in href:
-                    continue
-                
-                # Clean up the URL - remove query parameters for deduplication
-                base_url = href.split('?')[0] if '?' in href else href
-                
-                if base_url in seen_urls:
-                    continue
-                
-                # Build full URL
-                if href.startswith('http'):
-                    full_url = href
-                else:
-                    full_url = f"https://www.google.com{href}"
-                
-                seen_urls.add(base_url)
-                unique_urls.append(full_url)
-                
-            except Exception as e:
-                continue
-        
-        print(f"Extracted {len(unique_urls)} unique business URLs")
-        return unique_urls
+        """Extract all unique business URLs from the results in a single round trip"""
+        return await page.evaluate(_PLACE_URLS_JS)
     
-    async def _extract_business_data(self, page):
-        """Extract business information from the detail page"""
+    async def _extract_business_data(self, page, log):
+        """Extract business information from the detail page (problems are reported to `log`)"""
         data = {
             'name': 'not_available',
             'rating': 'not_available',
@@ -247,176 +340,68 @@ class GoogleMapsScraper:
             # Wait for the main content to load
             await page.wait_for_selector('h1', timeout=10000)
             
-            # Business name
-            try:
-                name_elem = await page.query_selector('h1.DUwDvf')
-                if not name_elem:
-                    name_elem = await page.query_selector('h1')
-                if name_elem:
-                    name_text = await name_elem.inner_text()
-                    data['name'] = name_text.strip()
-            except:
-                pass
-            
-            # Rating
-            try:
-                rating_elem = await page.query_selector('div.F7nice span[aria-hidden="true"]')
-                if rating_elem:
-                    data['rating'] = await rating_elem.inner_text()
-            except:
-                pass
-            
-            # Number of reviews
-            try:
-                reviews_elem = await page.query_selector('div.F7nice span[aria-label*="reviews"]')
-                if reviews_elem:
-                    reviews_text = await reviews_elem.inner_text()
-                    data['reviews'] = reviews_text.strip('()')
-            except:
-                pass
-            
-            # Address
-            try:
-                address_elem = await page.query_selector('button[data-item-id="address"] div.fontBodyMedium')
-                if address_elem:
-                    data['address'] = await address_elem.inner_text()
-            except:
-                pass
-            
-            # Phone number
-            try:
-                phone_elem = await page.query_selector('button[data-item-id*="phone:tel:"] div.fontBodyMedium')
-                if phone_elem:
-                    data['phone'] = await phone_elem.inner_text()
-            except:
-                pass
-            
-            # Website
-            try:
-                website_elem = await page.query_selector('a[data-item-id="authority"] div.fontBodyMedium')
-                if website_elem:
-                    data['website'] = await website_elem.inner_text()
-            except:
-                pass
-            
-            # Business hours
-            try:
-                hours_elem = await page.query_selector('button[data-item-id="oh"] div.fontBodyMedium')
-                if hours_elem:
-                    data['hours'] = await hours_elem.inner_text()
-            except:
-                pass
-            
-            # Try to find email
-            try:
-                email = await self._find_email(page)
-                if email != 'not_available':
-                    data['email'] = email
-            except:
-                pass
+            # Read every text field plus email/social matches in one round trip
+            fields = await page.evaluate(r"""() => {
+                const q = (s) => document.querySelector(s)?.innerText?.trim() || 'not_available';
+                const name = q('h1.DUwDvf');
+                
+                // Contacts are matched in the page so only the matches come back, not the whole DOM.
+                // A failure here must not cost the text fields, so it only leaves contacts empty.
+                const social = {};
+                let email = null;
+                try {
+                    const html = document.body.innerHTML;
+                    // One pass over the HTML for every platform, keeping the first link of each
+                    const socialRe = /(?:https?:\/\/)?(?:www\.)?(?:(facebook|instagram|twitter|x|youtube)\.com|(linkedin)\.com\/(?:company|in))\/[\w\-.]+/g;
+                    for (const m of html.matchAll(socialRe)) {
+                        const site = m[1] || m[2];
+                        const platform = site === 'x' ? 'twitter' : site;
+                        if (!(platform in social)) social[platform] = m[0];
+                        if (Object.keys(social).length === 5) break;
+                    }
+                    // First email whose domain isn't a common non-business one; stops at the first hit
+                    email = html.match(/\b[A-Za-z0-9._%+\-]+@(?![A-Za-z0-9.\-]*(?:google|schema\.org|example\.com))[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b/i);
+                } catch (e) {}
+                
+                return {
+                    name: name !== 'not_available' ? name : q('h1'),
+                    rating: q('div.F7nice span[aria-hidden="true"]'),
+                    reviews: document.querySelector('div.F7nice span[aria-label*="reviews"]')
+                        ?.innerText?.replace(/[()]/g, '') || 'not_available',
+                    address: q('button[data-item-id="address"] div.fontBodyMedium'),
+                    phone: q('button[data-item-id*="phone:tel:"] div.fontBodyMedium'),
+                    website: q('a[data-item-id="authority"] div.fontBodyMedium'),
+                    hours: q('button[data-item-id="oh"] div.fontBodyMedium'),
+                    email: email ? email[0] : 'not_available',
+                    social_media: social,
+                    category: q('button.DkEaL'),
+                    plus_code: q('button[data-item-id="oloc"] div.fontBodyMedium'),
+                };
+            }""")
+            social = fields.pop('social_media')
+            data.update(fields)
             
             # Social media links
-            try:
-                social = await self._find_social_media(page)
-                if social != 'not_available':
-                    data['social_media'] = social
-            except:
-                pass
-            
-            # Business type/category
-            try:
-                category_elem = await page.query_selector('button.DkEaL')
-                if category_elem:
-                    data['category'] = await category_elem.inner_text()
-            except:
-                pass
-            
-            # Plus Code / Location
-            try:
-                plus_code_elem = await page.query_selector('button[data-item-id="oloc"] div.fontBodyMedium')
-                if plus_code_elem:
-                    data['plus_code'] = await plus_code_elem.inner_text()
-            except:
-                pass
+            if social:
+                data['social_media'] = json.dumps(social)
             
         except Exception as e:
-            print(f"\n⚠ Error extracting data: {e}")
+            log.warning("⚠ Error extracting data: %s", e)
         
         return data
     
-    async def _find_email(self, page):
-        """Attempt to find email address"""
-        try:
-            content = await page.content()
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, content)
-            # Filter out common non-business emails
-            valid_emails = [e for e in emails if not any(x in e.lower() for x in ['google', 'schema.org', 'example.com'])]
-            return valid_emails[0] if valid_emails else 'not_available'
-        except:
-            return 'not_available'
-    
-    async def _find_social_media(self, page):
-        """Find social media links"""
-        social_media = {}
-        try:
-            content = await page.content()
-            
-            # Common social media patterns
-            platforms = {
-                'facebook': r'(?:https?://)?(?:www\.)?facebook\.com/[\w\-\.]+',
-                'instagram': r'(?:https?://)?(?:www\.)?instagram\.com/[\w\-\.]+',
-                'twitter': r'(?:https?://)?(?:www\.)?(?:twitter|x)\.com/[\w\-\.]+',
-                'linkedin': r'(?:https?://)?(?:www\.)?linkedin\.com/(?:company|in)/[\w\-\.]+',
-                'youtube': r'(?:https?://)?(?:www\.)?youtube\.com/[\w\-\.]+',
-            }
-            
-            for platform, pattern in platforms.items():
-                matches = re.findall(pattern, content)
-                if matches:
-                    # Get the first unique match
-                    social_media[platform] = matches[0]
-            
-            return json.dumps(social_media) if social_media else 'not_available'
-            
-        except Exception as e:
-            return 'not_available'
-    
     def _sanitize_filename(self, query):
         """Convert search query to a clean filename"""
         # Convert to lowercase and replace spaces with underscores
         filename = query.lower().replace(' ', '_')
         # Remove any characters that aren't alphanumeric, underscore, or hyphen
-        filename = re.sub(r'[^\w\-]', '', filename)
+        filename = _FILENAME_RE.sub('', filename)
         return filename
     
-    def save_to_csv(self, filename=None, search_query=None):
-        """Save results to CSV file"""
-        if not self.results:
-            print("No results to save")
-            return
-        
-        if not filename:
-            if search_query:
-                base_name = self._sanitize_filename(search_query)
-                filename = f"{base_name}.csv"
-            else:
-                filename = f"gmaps_scrape_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        keys = self.results[0].keys()
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(self.results)
-        
-        print(f"\n✓ Results saved to {filename}")
-        return filename
-    
-    def save_to_json(self, filename=None, search_query=None):
+    def save_to_json(self, results, filename=None, search_query=None):
         """Save results to JSON file"""
-        if not self.results:
-            print("No results to save")
+        if not results:
+            logger.warning("No results to save")
             return
         
         if not filename:
@@ -427,15 +412,15 @@ class GoogleMapsScraper:
                 filename = f"gmaps_scrape_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+            json.dump(results, f, indent=2, ensure_ascii=False)
         
-        print(f"✓ Results saved to {filename}")
+        logger.info("✓ Results saved to %s", filename)
         return filename
     
-    def save_to_excel(self, filename=None, search_query=None):
+    def save_to_excel(self, results, filename=None, search_query=None):
         """Save results to Excel file with formatting"""
-        if not self.results:
-            print("No results to save")
+        if not results:
+            logger.warning("No results to save")
             return
         
         if not filename:
@@ -445,116 +430,128 @@ class GoogleMapsScraper:
             else:
                 filename = f"gmaps_scrape_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         
-        # Create workbook and worksheet
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Business Data"
+        # Write-only workbook streams rows instead of keeping a cell object per value
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Business Data")
         
-        # Add headers
-        headers = list(self.results[0].keys())
-        ws.append(headers)
+        headers = FIELDS
+        rows = [_get_row(result) for result in results]
         
-        # Style headers
+        # Column widths have to be set before the first row is written in write-only mode
+        widths = [len(h) for h in headers]
+        for row in rows:
+            widths = [max(w, len(str(v))) for w, v in zip(widths, row)]
+        for i, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(i)].width = min(width + 2, 50)
+        
+        # Styled headers
         header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
         header_font = Font(bold=True, color="FFFFFF")
         
-        for cell in ws[1]:
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
             cell.fill = header_fill
             cell.font = header_font
+            header_cells.append(cell)
+        ws.append(header_cells)
         
         # Add data
-        for result in self.results:
-            ws.append(list(result.values()))
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        for row in rows:
+            ws.append(row)
         
         wb.save(filename)
-        print(f"✓ Results saved to {filename}")
+        logger.info("✓ Results saved to %s", filename)
         return filename
 
 queries = ["add all the queries to run on google maps to search google businesses", "like Freight brokers in Tracy"
 ]
 
+def _setup_logging():
+    """Send log records through a queue so scraping tasks never block on stdout"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, handler)
+    
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    return listener
+
 async def main():
     scraper = GoogleMapsScraper()
     
     total_queries = len(queries)
     max_results = None  # Set to None to scrape ALL results until end of list or define a limit
+    max_concurrent_queries = 3  # Queries scraped at the same time (each uses its own browser context)
     
-    print("=" * 60)
-    print("Google Maps Business Scraper - ROBUST VERSION")
-    print(f"Total Queries to Process: {total_queries}")
-    print("=" * 60)
-    print()
+    # Everything, scraper progress included, goes through the logging queue so output stays in order
+    listener = _setup_logging()
     
-    # Loop through each query in the queries array
-    for query_index, search_query in enumerate(queries, 1):
-        # Clear results before each query to avoid mixing data
-        scraper.results = []
-        
-        print("\n" + "=" * 60)
-        print(f"QUERY {query_index}/{total_queries}")
-        print("=" * 60)
-        print(f"Search Query: {search_query}")
-        print(f"Max Results: {'UNLIMITED (scrape until end)' if max_results is None else max_results}")
-        print("=" * 60)
-        
-        try:
-            # Scrape businesses for this query
-            results = await scraper.scrape_businesses(search_query, max_results)
-            
-            print(f"\n{'=' * 60}")
-            print(f"✓ Query {query_index}/{total_queries} Complete: {len(results)} businesses scraped")
-            print(f"{'=' * 60}")
+    logger.info("=" * 60)
+    logger.info("Google Maps Business Scraper - ROBUST VERSION")
+    logger.info("Total Queries to Process: %d", total_queries)
+    logger.info("=" * 60 + "\n")
+    
+    sem = asyncio.Semaphore(max_concurrent_queries)
+    
+    async def run_query(query_index, search_query, browser):
+        async with sem:
+            logger.info("\n".join([
+                "\n" + "=" * 60,
+                f"QUERY {query_index}/{total_queries}",
+                "=" * 60,
+                f"Search Query: {search_query}",
+                f"Max Results: {'UNLIMITED (scrape until end)' if max_results is None else max_results}",
+                "=" * 60,
+            ]))
             
-            # Save results in all formats for this query
-            if results:
-                scraper.save_to_json(search_query=search_query)
-                scraper.save_to_csv(search_query=search_query)
-                scraper.save_to_excel(search_query=search_query)
+            try:
+                # Scrape businesses for this query
+                results = await scraper.scrape_businesses(search_query, max_results, browser)
                 
-                # Display summary for this query
-                print("\n" + "-" * 60)
-                print(f"RESULTS PREVIEW FOR: {search_query}")
-                print("-" * 60)
-                for i, business in enumerate(results[:5], 1):
-                    print(f"\n{i}. {business.get('name', 'not_available')}")
-                    print(f"   Phone: {business.get('phone', 'not_available')}")
-                    print(f"   Email: {business.get('email', 'not_available')}")
-                    print(f"   Website: {business.get('website', 'not_available')}")
-                    print(f"   Address: {business.get('address', 'not_available')}")
-                    print(f"   Rating: {business.get('rating', 'not_available')} ({business.get('reviews', 'not_available')} reviews)")
-            else:
-                print(f"⚠ No results found for query: {search_query}")
-        
-        except Exception as e:
-            print(f"\n✗ Error processing query '{search_query}': {e}")
-            print("Continuing with next query...")
-            continue
-        
-        # Add separator between queries
-        if query_index < total_queries:
-            print(f"\n\n{'#' * 60}")
-            print(f"Moving to next query...")
-            print(f"{'#' * 60}\n")
-            await asyncio.sleep(2)  # Small delay between queries
+                logger.info("\n%s\n✓ Query %d/%d Complete: %d businesses scraped\n%s",
+                            "=" * 60, query_index, total_queries, len(results), "=" * 60)
+                
+                # CSV and JSON lines were streamed while scraping; export the rest once
+                if results:
+                    scraper.save_to_json(results, search_query=search_query)
+                    scraper.save_to_excel(results, search_query=search_query)
+                    
+                    # Display summary for this query (one record, so concurrent queries don't interleave)
+                    preview = ["\n" + "-" * 60, f"RESULTS PREVIEW FOR: {search_query}", "-" * 60]
+                    for i, business in enumerate(results[:5], 1):
+                        preview += [
+                            f"\n{i}. {business.get('name', 'not_available')}",
+                            f"   Phone: {business.get('phone', 'not_available')}",
+                            f"   Email: {business.get('email', 'not_available')}",
+                            f"   Website: {business.get('website', 'not_available')}",
+                            f"   Address: {business.get('address', 'not_available')}",
+                            f"   Rating: {business.get('rating', 'not_available')} ({business.get('reviews', 'not_available')} reviews)",
+                        ]
+                    logger.info("\n".join(preview))
+                else:
+                    logger.warning("⚠ No results found for query: %s", search_query)
+            
+            except Exception as e:
+                logger.error("\n✗ Error processing query '%s': %s", search_query, e)
     
-    # Final summary
-    print("\n" + "=" * 60)
-    print("ALL QUERIES COMPLETED!")
-    print(f"Processed {total_queries} queries")
-    print("=" * 60)
+    try:
+        # One browser process shared by every query
+        async with async_playwright() as p:
+            # Launch browser (set headless=False to watch what's happening)
+            browser = await p.chromium.launch(headless=True)
+            try:
+                await asyncio.gather(*(run_query(i, q, browser) for i, q in enumerate(queries, 1)))
+            finally:
+                await browser.close()
+        
+        # Final summary
+        logger.info("\n%s\nALL QUERIES COMPLETED!\nProcessed %d queries\n%s", "=" * 60, total_queries, "=" * 60)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":